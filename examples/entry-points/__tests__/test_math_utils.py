@@ -0,0 +1,79 @@
+"""
+Unit tests for math_utils.py
+
+Run with: python -m pytest examples
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import math_utils  # noqa: E402
+
+
+def test_batch_matches_scalar_compound_interest():
+    result = math_utils.compound_interest_batch([1000, 2500], [0.05, 0.03], [10, 4], n=[12, 4])
+    assert result["count"] == 2
+    assert result["results"] == [
+        math_utils.compound_interest(1000, 0.05, 10, 12),
+        math_utils.compound_interest(2500, 0.03, 4, 4),
+    ]
+
+
+def test_batch_broadcasts_scalars():
+    result = math_utils.compound_interest_batch(1000, [0.01, 0.02, 0.03], 5)
+    assert result["count"] == 3
+    assert [r["principal"] for r in result["results"]] == [1000, 1000, 1000]
+    assert result["results"][2] == math_utils.compound_interest(1000, 0.03, 5)
+
+
+def test_batch_all_scalars_is_single_scenario():
+    result = math_utils.compound_interest_batch(1000, 0.05, 10)
+    assert result == {"count": 1, "results": [math_utils.compound_interest(1000, 0.05, 10)]}
+
+
+def test_batch_rejects_mismatched_lengths():
+    result = math_utils.compound_interest_batch([1000, 2000], [0.05, 0.03, 0.01], 10)
+    assert "error" in result
+
+
+def _loan_payment_power(principal, rate, months):
+    """The original (1 + r)**n formula, kept as a reference"""
+    monthly_rate = rate / 12
+    if monthly_rate == 0:
+        payment = principal / months
+    else:
+        payment = principal * (monthly_rate * (1 + monthly_rate)**months) / ((1 + monthly_rate)**months - 1)
+    return {
+        "monthly_payment": round(payment, 2),
+        "total_payment": round(payment * months, 2),
+        "total_interest": round(payment * months - principal, 2)
+    }
+
+
+def _retirement_total_power(months, monthly_contribution, annual_return):
+    """The original projected_total formula, kept as a reference"""
+    monthly_return = annual_return / 12
+    if monthly_return == 0:
+        return monthly_contribution * months
+    return round(monthly_contribution * (((1 + monthly_return)**months - 1) / monthly_return), 2)
+
+
+def test_loan_payment_tiny_rate_repays_principal():
+    result = math_utils.loan_payment(1_000_000, 1e-12, 360)
+    assert result == {"monthly_payment": 2777.78, "total_payment": 1000000.0, "total_interest": 0.0}
+
+
+def test_loan_payment_ordinary_rates_match_power_formula():
+    for principal in (1000, 25_000, 350_000):
+        for rate in (0.0, 0.01, 0.035, 0.07, 0.12, 0.25):
+            for months in (12, 60, 180, 360):
+                assert math_utils.loan_payment(principal, rate, months) == _loan_payment_power(principal, rate, months)
+
+
+def test_retirement_savings_ordinary_rates_match_power_formula():
+    for annual_return in (0.0, 0.02, 0.05, 0.07, 0.1):
+        for current_age, retirement_age in ((25, 65), (40, 67), (60, 61)):
+            result = math_utils.retirement_savings(current_age, retirement_age, 500, annual_return)
+            months = (retirement_age - current_age) * 12
+            assert result["projected_total"] == _retirement_total_power(months, 500, annual_return)
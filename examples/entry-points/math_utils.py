@@ -2,6 +2,8 @@
 Math utilities module with multiple entry points.
 This file can be used by multiple tools with different entry points.
 """
+import math
+
 
 def calculate_tax(income, tax_rate):
     """Calculate tax amount based on income and rate."""
@@ -20,13 +22,46 @@ def compound_interest(principal, rate, time, n=12):
         "total_amount": round(amount, 2)
     }
 
+def compound_interest_batch(principals, rates, times, n=12):
+    """Calculate compound interest for many scenarios in a single call.
+
+    Each argument may be a list or a single number; single numbers are
+    reused for every scenario, so a rate sweep only needs a list of rates.
+    """
+    columns = [principals, rates, times, n]
+    sizes = {len(col) for col in columns if isinstance(col, list)}
+    if len(sizes) > 1:
+        return {"error": "All list arguments must have the same length"}
+    count = sizes.pop() if sizes else 1
+    principals, rates, times, n = [
+        col if isinstance(col, list) else [col] * count for col in columns
+    ]
+
+    results = []
+    for i in range(count):
+        principal = principals[i]
+        periods = n[i]
+        amount = principal * (1 + rates[i]/periods) ** (periods * times[i])
+        results.append({
+            "principal": principal,
+            "interest": round(amount - principal, 2),
+            "total_amount": round(amount, 2)
+        })
+
+    return {
+        "count": count,
+        "results": results
+    }
+
 def loan_payment(principal, rate, months):
     """Calculate monthly loan payment."""
     monthly_rate = rate / 12
     if monthly_rate == 0:
         payment = principal / months
     else:
-        payment = principal * (monthly_rate * (1 + monthly_rate) ** months) / ((1 + monthly_rate) ** months - 1)
+        # (1 + r)^n - 1 via expm1/log1p stays accurate for tiny rates
+        growth = math.expm1(months * math.log1p(monthly_rate))
+        payment = principal * monthly_rate * (growth + 1) / growth
     
     return {
         "monthly_payment": round(payment, 2),
@@ -42,7 +77,8 @@ def retirement_savings(current_age, retirement_age, monthly_contribution, annual
     if monthly_return == 0:
         total = monthly_contribution * months
     else:
-        total = monthly_contribution * ((1 + monthly_return) ** months - 1) / monthly_return
+        growth = math.expm1(months * math.log1p(monthly_return))
+        total = monthly_contribution * growth / monthly_return
     
     return {
         "years_to_retirement": retirement_age - current_age,
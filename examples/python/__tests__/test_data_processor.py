@@ -0,0 +1,121 @@
+"""
+Unit tests for data_processor.py
+
+Run with: python -m pytest examples
+"""
+import inspect
+import json
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import data_processor  # noqa: E402
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib json"""
+    if request.param == "orjson":
+        if data_processor.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(data_processor, "orjson", None)
+    return request.param
+
+
+CSV = "name,city\nzoë,köln\n,paris\nbob,berlin\n"
+
+
+def test_process_csv_path_reads_utf8(tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_bytes(CSV.encode("utf-8"))
+    result = data_processor.process_csv_path(str(path), "transform")
+    assert result["row_count"] == 3
+    assert result["data"][0] == {"name": "ZOË", "city": "KÖLN"}
+
+
+def test_process_csv_path_matches_string_input(tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_bytes(CSV.encode("utf-8"))
+    for operation in ("parse", "filter", "transform"):
+        assert data_processor.process_csv_path(str(path), operation) == data_processor.process_csv(CSV, operation)
+
+
+def test_main_does_not_accept_a_path():
+    assert "path" not in inspect.signature(data_processor.main).parameters
+
+
+@pytest.mark.parametrize("text", [
+    '{"n": 123456789012345678901234567890}',
+    '[18446744073709551615, 18446744073709551616]',
+    '[-9223372036854775809]',
+    '{"n": -9999999999999999999}',
+    '[-9223372036854775808, 9223372036854775807]',
+    '{"id": "12345678901234567890123", "score": 0.5}',
+    '{"name": "zo\u00eb", "values": [1, 2.5, null, true]}',
+])
+def test_json_loads_matches_stdlib(json_backend, text):
+    assert data_processor._json_loads(text) == json.loads(text)
+
+
+def test_json_loads_accepts_nan(json_backend):
+    assert math.isnan(data_processor._json_loads('{"x": NaN}')["x"])
+
+
+@pytest.mark.parametrize("n", [123456789012345678901234567890, -9999999999999999999, -9223372036854775809])
+def test_json_big_integers_stay_exact(json_backend, n):
+    result = data_processor.main(f'{{"n": {n}}}', "json")
+    assert result["data"] == {"n": n}
+    assert type(result["data"]["n"]) is int
+
+
+def test_invalid_json_reports_error(json_backend):
+    assert "error" in data_processor.main('{"n": ', "json")
+
+
+def _flatten_recursive(obj, parent_key='', sep='.'):
+    """The original recursive flatten_json, kept as a reference"""
+    items = []
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            new_key = f"{parent_key}{sep}{k}" if parent_key else k
+            if isinstance(v, dict):
+                items.extend(_flatten_recursive(v, new_key, sep=sep).items())
+            else:
+                items.append((new_key, v))
+    else:
+        items.append((parent_key, obj))
+    return dict(items)
+
+
+def test_flatten_json_keeps_document_order():
+    obj = {"b": 1, "a": {"z": 2, "y": {"x": 3}}, "c": [4, {"d": 5}]}
+    flattened = data_processor.flatten_json(obj)
+    assert list(flattened.items()) == [("b", 1), ("a.z", 2), ("a.y.x", 3), ("c", [4, {"d": 5}])]
+    assert list(flattened.items()) == list(_flatten_recursive(obj).items())
+
+
+def test_flatten_json_drops_empty_dicts():
+    obj = {"a": {}, "b": {"c": {}}, "d": 1}
+    assert data_processor.flatten_json(obj) == {"d": 1} == _flatten_recursive(obj)
+    assert data_processor.flatten_json({}) == {}
+
+
+def test_flatten_json_non_dict_root():
+    assert data_processor.flatten_json([1, 2], parent_key="root") == {"root": [1, 2]}
+    assert data_processor.flatten_json(7) == {"": 7}
+    assert data_processor.flatten_json({"a": 1}, parent_key="p", sep="/") == {"p/a": 1}
+
+
+def test_flatten_json_nesting_past_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    obj = leaf = {}
+    for _ in range(depth):
+        leaf["k"] = {}
+        leaf = leaf["k"]
+    leaf["k"] = "bottom"
+    assert data_processor.flatten_json(obj) == {".".join(["k"] * (depth + 1)): "bottom"}
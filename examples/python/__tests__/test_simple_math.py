@@ -0,0 +1,147 @@
+"""
+Unit tests for simple_math.py
+
+Run with: python -m pytest examples
+"""
+import math
+import os
+import random
+import sys
+import warnings
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import simple_math  # noqa: E402
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def backend(request, monkeypatch):
+    """Run a test with NumPy (when installed) and with pure Python"""
+    if request.param == "numpy":
+        if simple_math.np is None:
+            pytest.skip("numpy is not installed")
+    else:
+        monkeypatch.setattr(simple_math, "np", None)
+    return request.param
+
+
+_rng = random.Random(0)
+LONG = [_rng.uniform(-100, 100) for _ in range(5000)]
+
+
+def test_mean_keeps_integer_exactness(backend):
+    result = simple_math.main("mean", [10**20, 1, -10**20])
+    assert result == {"result": 1 / 3, "count": 3, "sum": 1}
+
+
+@pytest.mark.parametrize("operation", ["mean", "variance", "stddev"])
+@pytest.mark.parametrize("values", [["1", "2"], ["1"] * 2000])
+def test_strings_are_rejected(backend, operation, values):
+    assert "error" in simple_math.main(operation, values)
+
+
+@pytest.mark.parametrize("values", [[10**20, 1, -10**20] * 400, [2**60 + 1] * 1001 + [1]])
+def test_variance_of_huge_ints_matches_pure_python(values):
+    mean_val = sum(values) / len(values)
+    expected = sum((x - mean_val) ** 2 for x in values) / (len(values) - 1)
+    assert simple_math.main("variance", values)["result"] == expected
+
+
+@pytest.mark.parametrize("operation", ["variance", "stddev"])
+@pytest.mark.parametrize("size", [10, 1000])
+def test_variance_overflow_is_an_error(backend, operation, size):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = simple_math.main(operation, [1e200] * size + [0.0])
+    assert result == {"error": "(34, 'Numerical result out of range')", "operation": operation}
+
+
+def test_long_list_statistics(backend):
+    mean_val = sum(LONG) / len(LONG)
+    variance = sum((x - mean_val) ** 2 for x in LONG) / (len(LONG) - 1)
+    ordered = sorted(LONG)
+    assert math.isclose(simple_math.main("variance", LONG)["result"], variance, rel_tol=1e-12)
+    assert math.isclose(simple_math.main("stddev", LONG)["result"], math.sqrt(variance), rel_tol=1e-12)
+    assert simple_math.main("median", LONG)["result"] == (ordered[2499] + ordered[2500]) / 2
+    assert simple_math.main("median", LONG + [1000.0])["result"] == ordered[2500]
+    assert simple_math.main("median", LONG, options={"include_sorted": True})["sorted"] == ordered
+
+
+@pytest.mark.parametrize("n", [
+    318665857834031151167461,  # strong pseudoprime to the bases 2..37
+    3317044064679887385961981,  # strong pseudoprime to the bases 2..41
+])
+def test_prime_check_rejects_strong_pseudoprimes(n):
+    assert simple_math.main("prime_check", n)["result"] is False
+
+
+def test_prime_check_matches_trial_division():
+    for n in range(2, 20000):
+        expected = next((i for i in range(2, math.isqrt(n) + 1) if n % i == 0), None)
+        result = simple_math.main("prime_check", n, options={"include_factor": True})
+        assert result["result"] is (expected is None)
+        assert result.get("factor") == expected
+
+
+def test_prime_check_factor_is_opt_in():
+    assert simple_math.main("prime_check", 1763) == {"result": False, "number": 1763, "factor": 41}
+    assert simple_math.main("prime_check", 10403) == {"result": False, "number": 10403}
+    assert simple_math.main("prime_check", 10403, options={"include_factor": True})["factor"] == 101
+
+
+def test_prime_check_marks_probable_primes_above_limit():
+    assert simple_math.main("prime_check", 2**61 - 1) == {"result": True, "number": 2**61 - 1}
+    assert simple_math.main("prime_check", 2**89 - 1)["probable"] is True
+
+
+def _fib_loop(count):
+    """First `count` Fibonacci numbers, computed the way main() lists them"""
+    fib = [0, 1]
+    for _ in range(2, count):
+        fib.append(fib[-1] + fib[-2])
+    return fib[:count]
+
+
+def test_fib_pair_matches_loop():
+    fib = _fib_loop(3000)
+    for n in list(range(0, 300)) + [998, 999, 1000, 1001, 2998]:
+        assert simple_math._fib_pair(n) == (fib[n], fib[n + 1])
+
+
+def test_fibonacci_sequence_up_to_limit():
+    result = simple_math.main("fibonacci", 1000)
+    assert result == {"result": _fib_loop(1000), "count": 1000, "last": _fib_loop(1000)[-1]}
+    assert "note" not in result
+
+
+def test_fibonacci_past_limit_returns_last_term():
+    result = simple_math.main("fibonacci", 1001)
+    last = _fib_loop(1001)[-1]  # F(1000)
+    assert result["result"] == last
+    assert result["last"] == last
+    assert result["count"] == 1001
+    assert "1000" in result["note"]
+
+
+@pytest.mark.parametrize("n, expected", [(0, []), (1, [0]), (2, [0, 1]), (5, [0, 1, 1, 2, 3])])
+def test_fibonacci_small(n, expected):
+    assert simple_math.main("fibonacci", n)["result"] == expected
+
+
+@pytest.mark.parametrize("values", [list(range(999)), list(range(1001)), list(range(1000)), [3, 1, 2] * 700])
+def test_median_keeps_int_type(backend, values):
+    ordered = sorted(values)
+    k = len(values) // 2
+    expected = ordered[k] if len(values) % 2 else (ordered[k - 1] + ordered[k]) / 2
+    result = simple_math.main("median", values)["result"]
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_median_include_sorted_returns_original_values(backend):
+    values = list(range(1500, 0, -1))
+    result = simple_math.main("median", values, options={"include_sorted": True})
+    assert result["sorted"] == sorted(values)
+    assert all(type(x) is int for x in result["sorted"])
@@ -0,0 +1,25 @@
+"""
+Unit tests for text_analyzer.py
+
+Run with: python -m pytest examples
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import text_analyzer  # noqa: E402
+
+
+def test_character_frequency_lowers_each_character():
+    # "Σ".lower() is "σ" even at the end of a word, and "İ".lower() is one
+    # two-code-point key; text.lower() would give "ς" and split the "İ"
+    result = text_analyzer.frequency_analysis("ΣΟΦΟΣ σοφός \u0130\u0130")
+    assert result["top_10_characters"] == {
+        "σ": 3, "ο": 3, "φ": 2, "i\u0307": 2, "ό": 1, "ς": 1
+    }
+
+
+def test_character_frequency_skips_whitespace():
+    result = text_analyzer.frequency_analysis("Aa b\n\tB")
+    assert result["top_10_characters"] == {"a": 2, "b": 2}
@@ -0,0 +1,125 @@
+"""
+Unit tests for web_scraper.py
+
+Run with: python -m pytest examples
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import web_scraper  # noqa: E402
+
+
+HTML = (
+    "<html><head><meta name='description' content='demo'></head><body>"
+    "<h1>Title</h1><h2>  Sub\n  <i>title</i> </h2>"
+    "<p>Hello <b>world</b>!</p><p>one<p>two</p><p>unclosed <a href='/x' title='t'>link</a>"
+    "<img src='a.png' alt='A'>"
+    "</body></html>"
+)
+
+
+@pytest.fixture(params=["lxml", "fallback"])
+def parser(request, monkeypatch):
+    """Run a test with lxml (when installed) and with SimpleHTMLParser"""
+    if request.param == "lxml":
+        if web_scraper.lxml_html is None:
+            pytest.skip("lxml is not installed")
+    else:
+        monkeypatch.setattr(web_scraper, "lxml_html", None)
+    return request.param
+
+
+@pytest.mark.parametrize("content", [
+    "<!-- contact foo@bar.com -->",
+    "<!DOCTYPE html>",
+    "<?xml version='1.0'?>",
+])
+def test_markup_only_documents_parse_as_empty(parser, content):
+    doc = web_scraper.parse_html(content)
+    assert doc == web_scraper.ParsedDoc()
+
+
+def test_emails_in_comment_only_document(parser):
+    result = web_scraper.main("<!-- contact foo@bar.com -->", "emails")
+    assert result == {"success": True, "emails": ["foo@bar.com"], "total_found": 1}
+
+
+def test_unknown_type_reported_for_unparsable_document(parser):
+    result = web_scraper.main("<!-- only a comment -->", "bogus")
+    assert result["error"] == "Unknown extraction type: bogus"
+
+
+def test_parse_html_text(parser):
+    doc = web_scraper.parse_html(HTML)
+    assert doc.paragraphs == ["Hello world!", "one", "two", "unclosed link"]
+    assert doc.headings["h1"] == ["Title"]
+    assert doc.headings["h2"] == ["Sub title"]
+    assert doc.links == [{"href": "/x", "title": "t", "rel": ""}]
+    assert doc.images == [{"src": "a.png", "alt": "A", "title": ""}]
+    assert doc.meta_tags == [{"name": "description", "content": "demo"}]
+
+
+def test_lxml_and_fallback_agree(monkeypatch):
+    if web_scraper.lxml_html is None:
+        pytest.skip("lxml is not installed")
+    expected = web_scraper.parse_html(HTML)
+    monkeypatch.setattr(web_scraper, "lxml_html", None)
+    assert web_scraper.parse_html(HTML) == expected
+
+
+PHONE_TEXT = "Call 555-123-4567 or (555) 987 6543, intl +44 20 7946 0958. Mail bob@example.com. "
+SPARSE_TEXT = ("lorem ipsum dolor sit amet " * 40 + PHONE_TEXT) * 20
+DENSE_DIGITS = "".join("0123456789 -"[(i * 7) % 12] for i in range(20000))
+
+
+def _re_only(kind, content):
+    patterns = web_scraper._PATTERNS[kind]
+    patterns = patterns if isinstance(patterns, list) else [patterns]
+    return [match for pattern in patterns for match in pattern.findall(content)]
+
+
+@pytest.mark.parametrize("kind", ["phone", "email", "url"])
+@pytest.mark.parametrize("content", [
+    SPARSE_TEXT,
+    DENSE_DIGITS,
+    "zoë 555-123-4567 zoë@example.com",
+    "lorem " * 50 + "555\x1f123\x1f4567",  # re's \s also matches \x1c-\x1f
+    "call 555\x1c123\x1f4567 now +1\x1d555\x0b123\x0c4567",
+    "".join(map(chr, range(128))) * 3 + PHONE_TEXT,
+])
+def test_findall_matches_re(kind, content):
+    assert web_scraper._findall(kind, content) == _re_only(kind, content)
+
+
+def test_findall_without_hyperscan(monkeypatch):
+    monkeypatch.setattr(web_scraper, "_SCAN_DBS", {})
+    assert web_scraper._findall("phone", PHONE_TEXT) == _re_only("phone", PHONE_TEXT)
+
+
+def test_findall_stops_scan_on_dense_matches(monkeypatch):
+    if web_scraper._SCAN_DBS.get("phone") is None:
+        pytest.skip("hyperscan is not installed")
+    calls = []
+    monkeypatch.setattr(web_scraper, "_re_findall", lambda patterns, content: calls.append(content) or [])
+    web_scraper._findall("phone", DENSE_DIGITS)
+    assert calls == [DENSE_DIGITS]
+    calls.clear()
+    web_scraper._findall("phone", SPARSE_TEXT)
+    assert calls == []
+
+
+@pytest.mark.parametrize("sku", [123456789012345678901234567890, -9223372036854775809])
+def test_json_ld_big_integers_stay_exact(monkeypatch, sku):
+    content = (
+        '<script type="application/ld+json">'
+        f'{{"@type": "Product", "sku": {sku}}}'
+        '</script>'
+    )
+    expected = [{"@type": "Product", "sku": sku}]
+    assert web_scraper.main(content, "structured")["json_ld"] == expected
+    monkeypatch.setattr(web_scraper, "orjson", None)
+    assert web_scraper.main(content, "structured")["json_ld"] == expected
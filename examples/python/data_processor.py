@@ -5,6 +5,34 @@ Processes CSV and JSON data with various transformations
 import json
 import csv
 from io import StringIO
+from itertools import islice
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
+
+# Some orjson releases silently parse integers outside the 64-bit range as
+# floats. Such a literal has at least 19 digits (-9223372036854775809 has
+# 19), which _json_loads finds by mapping every digit to "0" (much faster
+# than a regex) and leaves to the stdlib.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_LONG_DIGIT_RUN = b"0" * 19
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when installed, else with the stdlib json"""
+    if orjson is not None:
+        raw = data.encode("utf-8", "surrogatepass")
+        if raw.translate(_DIGITS_TO_ZERO).find(_LONG_DIGIT_RUN) < 0:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # The stdlib also accepts NaN/Infinity and lone surrogates,
+                # and gives the error message when the input really is invalid
+                pass
+    return json.loads(data)
 
 
 def main(data, format, operation="parse"):
@@ -38,51 +66,80 @@ def main(data, format, operation="parse"):
 
 def process_csv(data, operation):
     """Process CSV data"""
-    reader = csv.DictReader(StringIO(data))
-    rows = list(reader)
+    return process_csv_rows(csv.DictReader(StringIO(data)), operation)
+
+
+def process_csv_path(path, operation):
+    """
+    Process a UTF-8 CSV file, reading it row by row rather than all at once.
 
+    For use when importing this module directly; it is deliberately not
+    reachable through main(), so a registered tool cannot be used to read
+    arbitrary files.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        return process_csv_rows(csv.DictReader(f), operation)
+
+
+def _count_remaining_rows(reader):
+    """Count the rows a csv.DictReader has not yet returned"""
+    # Iterate the underlying csv.reader so no dict is built per row; like
+    # DictReader, skip blank lines
+    return sum(1 for row in reader.reader if row)
+
+
+def process_csv_rows(reader, operation):
+    """Process rows from a csv.DictReader"""
+    if operation not in ("parse", "filter", "transform"):
+        return {
+            "success": False,
+            "error": f"Unknown operation: {operation}"
+        }
+
+    # Stream rows instead of materializing the whole file: only the first
+    # 10 results are returned, so the rest only need to be counted
     if operation == "parse":
+        rows = list(islice(reader, 10))
         return {
             "success": True,
-            "row_count": len(rows),
+            "row_count": len(rows) + _count_remaining_rows(reader),
             "columns": reader.fieldnames,
-            "data": rows[:10]  # Return first 10 rows
+            "data": rows  # Return first 10 rows
         }
     elif operation == "filter":
         # Example: filter rows with non-empty first column
-        filtered = [
-            row for row in rows
-            if reader.fieldnames
-            and row.get(reader.fieldnames[0])
-            and row[reader.fieldnames[0]]
-        ]
+        first_column = reader.fieldnames[0] if reader.fieldnames else None
+        original_count = 0
+        filtered_count = 0
+        filtered = []
+        for row in reader:
+            original_count += 1
+            if first_column is not None and row.get(first_column):
+                filtered_count += 1
+                if len(filtered) < 10:
+                    filtered.append(row)
         return {
             "success": True,
-            "original_count": len(rows),
-            "filtered_count": len(filtered),
-            "data": filtered[:10]
+            "original_count": original_count,
+            "filtered_count": filtered_count,
+            "data": filtered
         }
-    elif operation == "transform":
-        # Example: convert all values to uppercase
+    else:
+        # Example: convert all values to uppercase (only the returned rows)
         transformed = [
-            {k: v.upper() if isinstance(v, str) else v for k, v in row.items()}
-            for row in rows
+            {k: v.upper() if type(v) is str else v for k, v in row.items()}
+            for row in islice(reader, 10)
         ]
         return {
             "success": True,
-            "row_count": len(transformed),
-            "data": transformed[:10]
-        }
-    else:
-        return {
-            "success": False,
-            "error": f"Unknown operation: {operation}"
+            "row_count": len(transformed) + _count_remaining_rows(reader),
+            "data": transformed
         }
 
 
 def process_json(data, operation):
     """Process JSON data"""
-    parsed = json.loads(data)
+    parsed = _json_loads(data)
 
     if operation == "parse":
         return {
@@ -124,14 +181,15 @@ def process_json(data, operation):
 
 def flatten_json(obj, parent_key='', sep='.'):
     """Flatten nested JSON structure"""
-    items = []
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(flatten_json(v, new_key, sep=sep).items())
-            else:
-                items.append((new_key, v))
-    else:
-        items.append((parent_key, obj))
-    return dict(items)
+    # Walk with an explicit stack rather than recursing per nested dict;
+    # children are pushed in reverse so keys come out in document order
+    flattened = {}
+    stack = [(parent_key, obj)]
+    while stack:
+        key, value = stack.pop()
+        if isinstance(value, dict):
+            for k, v in reversed(value.items()):
+                stack.append((f"{key}{sep}{k}" if key else k, v))
+        else:
+            flattened[key] = value
+    return flattened
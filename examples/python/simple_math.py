@@ -3,10 +3,125 @@ Simple Math Functions
 Provides basic and advanced mathematical operations
 """
 import math
+from collections import Counter
 from typing import Union, List
 
+try:
+    import numpy as np
+except ImportError:  # Fall back to pure-Python statistics
+    np = None
 
-def main(operation: str, a: Union[float, List[float]], b: Union[float, None] = None) -> dict:
+
+# Below this length converting to an array costs more than NumPy saves
+_NUMPY_MIN_LENGTH = 1000
+
+# Largest integer magnitude float64 represents exactly
+_FLOAT64_EXACT_INT = 2 ** 53
+
+
+def _as_float64_array(a: list):
+    """
+    Return a list of numbers as a float64 array, or None to use pure Python.
+
+    Short lists, and lists holding anything but floats and ints that
+    float64 represents exactly (strings, huge ints), stay on the
+    pure-Python path so they give the same results and errors as before.
+    """
+    if np is None or len(a) < _NUMPY_MIN_LENGTH:
+        return None
+    types = set(map(type, a))
+    if not types <= {float, int, bool}:
+        return None
+    if types != {float} and (max(a) > _FLOAT64_EXACT_INT or min(a) < -_FLOAT64_EXACT_INT):
+        return None
+    return np.asarray(a, dtype=np.float64)
+
+
+def _sample_variance(a: List[float]) -> tuple:
+    """Return (mean, sample variance) of a list of at least two numbers"""
+    arr = _as_float64_array(a)
+    if arr is not None:
+        with np.errstate(over="ignore", invalid="ignore"):
+            mean_val = float(arr.mean())
+            deviations = arr - mean_val
+            variance = float(deviations @ deviations) / (arr.size - 1)
+        # float64 overflows to inf where pure Python raises OverflowError;
+        # let the pure-Python path produce the same result or error
+        if math.isfinite(mean_val) and math.isfinite(variance):
+            return mean_val, variance
+    mean_val = sum(a) / len(a)
+    return mean_val, sum((x - mean_val) ** 2 for x in a) / (len(a) - 1)
+
+
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Miller-Rabin with the _SMALL_PRIMES witnesses is deterministic below this
+# bound (Sorenson & Webster, 2015); above it the test is probabilistic
+_MILLER_RABIN_LIMIT = 3317044064679887385961981
+
+# Extra witnesses for n at or above _MILLER_RABIN_LIMIT
+_EXTRA_WITNESSES = (43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+
+def _miller_rabin(n: int) -> bool:
+    """
+    Miller-Rabin primality test using the first thirteen primes as witnesses.
+
+    Deterministic for every n below 3.3 * 10**24 (which covers all 64-bit
+    integers) and needs only O(log n) modular exponentiations. Larger n
+    are also tested against _EXTRA_WITNESSES, so a True result for them
+    means "probable prime".
+    """
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    witnesses = _SMALL_PRIMES if n < _MILLER_RABIN_LIMIT else _SMALL_PRIMES + _EXTRA_WITNESSES
+    for a in witnesses:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _smallest_factor(n: int) -> int:
+    """Smallest prime factor of a composite n > 1, by trial division"""
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return p
+    for i in range(_SMALL_PRIMES[-1] + 2, math.isqrt(n) + 1, 2):
+        if n % i == 0:
+            return i
+    return n
+
+
+# Longest Fibonacci sequence returned in full; beyond it only F(n-1) is
+_FIB_SEQUENCE_LIMIT = 1000
+
+
+def _fib_pair(n: int) -> tuple:
+    """Return (F(n), F(n+1)) by fast doubling in O(log n) multiplications"""
+    if n == 0:
+        return (0, 1)
+    a, b = _fib_pair(n >> 1)
+    c = a * ((b << 1) - a)  # F(2k)
+    d = a * a + b * b  # F(2k+1)
+    return (c, d) if n & 1 == 0 else (d, c + d)
+
+
+def main(operation: str, a: Union[float, List[float]], b: Union[float, None] = None,
+         options: Union[dict, None] = None) -> dict:
     """
     Perform various mathematical operations.
     
@@ -14,10 +129,17 @@ def main(operation: str, a: Union[float, List[float]], b: Union[float, None] = N
         operation (str): The mathematical operation to perform
         a (Union[float, List[float]]): First operand or list of numbers
         b (Union[float, None]): Second operand (optional for some operations)
+        options (Union[dict, None]): Extra output options, e.g.
+            {"include_sorted": True} to return the sorted list from median,
+            {"include_frequency": False} to omit the counts from mode,
+            {"include_factor": True} to always find a factor in prime_check
     
     Returns:
         dict: Result of the mathematical operation
     """
+    if options is None:
+        options = {}
+    
     try:
         if operation == "add":
             if b is None:
@@ -73,41 +195,57 @@ def main(operation: str, a: Union[float, List[float]], b: Union[float, None] = N
                 return {"error": "Mean requires a list of numbers"}
             if not a:
                 return {"error": "Cannot calculate mean of empty list"}
-            mean_val = sum(a) / len(a)
-            return {"result": mean_val, "count": len(a), "sum": sum(a)}
+            total = sum(a)
+            return {"result": total / len(a), "count": len(a), "sum": total}
         
         elif operation == "median":
             if not isinstance(a, list):
                 return {"error": "Median requires a list of numbers"}
             if not a:
                 return {"error": "Cannot calculate median of empty list"}
+            include_sorted = options.get("include_sorted", False)
+            n = len(a)
+            arr = None if include_sorted else _as_float64_array(a)
+            if arr is not None:
+                # Partial selection finds the middle element(s) in O(n); the
+                # values come from `a` itself so ints stay ints, as with sorted()
+                k = n // 2
+                if n % 2 == 0:
+                    idx = np.argpartition(arr, [k - 1, k])
+                    median_val = (a[idx[k - 1]] + a[idx[k]]) / 2
+                else:
+                    median_val = a[np.argpartition(arr, k)[k]]
+                return {"result": median_val, "count": n}
             sorted_list = sorted(a)
-            n = len(sorted_list)
             if n % 2 == 0:
                 median_val = (sorted_list[n//2 - 1] + sorted_list[n//2]) / 2
             else:
                 median_val = sorted_list[n//2]
-            return {"result": median_val, "count": n, "sorted": sorted_list}
+            result = {"result": median_val, "count": n}
+            if include_sorted:
+                result["sorted"] = sorted_list
+            return result
         
         elif operation == "mode":
             if not isinstance(a, list):
                 return {"error": "Mode requires a list of numbers"}
             if not a:
                 return {"error": "Cannot calculate mode of empty list"}
-            frequency = {}
-            for num in a:
-                frequency[num] = frequency.get(num, 0) + 1
-            max_freq = max(frequency.values())
+            frequency = Counter(a)
+            max_freq = frequency.most_common(1)[0][1]
             modes = [num for num, freq in frequency.items() if freq == max_freq]
-            return {"result": modes[0] if len(modes) == 1 else modes, "frequency": frequency}
+            result = {"result": modes[0] if len(modes) == 1 else modes}
+            # Copying the counts dominates for lists with many distinct values
+            if options.get("include_frequency", True):
+                result["frequency"] = dict(frequency)
+            return result
         
         elif operation == "variance":
             if not isinstance(a, list):
                 return {"error": "Variance requires a list of numbers"}
             if len(a) < 2:
                 return {"error": "Variance requires at least 2 numbers"}
-            mean_val = sum(a) / len(a)
-            variance = sum((x - mean_val) ** 2 for x in a) / (len(a) - 1)
+            mean_val, variance = _sample_variance(a)
             return {"result": variance, "mean": mean_val, "count": len(a)}
         
         elif operation == "stddev":
@@ -115,8 +253,7 @@ def main(operation: str, a: Union[float, List[float]], b: Union[float, None] = N
                 return {"error": "Standard deviation requires a list of numbers"}
             if len(a) < 2:
                 return {"error": "Standard deviation requires at least 2 numbers"}
-            mean_val = sum(a) / len(a)
-            variance = sum((x - mean_val) ** 2 for x in a) / (len(a) - 1)
+            mean_val, variance = _sample_variance(a)
             stddev = math.sqrt(variance)
             return {"result": stddev, "variance": variance, "mean": mean_val}
         
@@ -124,10 +261,19 @@ def main(operation: str, a: Union[float, List[float]], b: Union[float, None] = N
             n = int(a)
             if n < 2:
                 return {"result": False, "number": n, "reason": "Less than 2"}
-            for i in range(2, int(math.sqrt(n)) + 1):
-                if n % i == 0:
-                    return {"result": False, "number": n, "factor": i}
-            return {"result": True, "number": n}
+            if _miller_rabin(n):
+                result = {"result": True, "number": n}
+                if n >= _MILLER_RABIN_LIMIT:
+                    result["probable"] = True
+                return result
+            if options.get("include_factor", False):
+                # Trial division, which can take O(sqrt(n)) steps
+                return {"result": False, "number": n, "factor": _smallest_factor(n)}
+            # Otherwise only report a factor when it is one of the small primes
+            factor = next((p for p in _SMALL_PRIMES if n % p == 0), None)
+            if factor is None:
+                return {"result": False, "number": n}
+            return {"result": False, "number": n, "factor": factor}
         
         elif operation == "fibonacci":
             n = int(a)
@@ -137,6 +283,14 @@ def main(operation: str, a: Union[float, List[float]], b: Union[float, None] = N
                 return {"result": [], "count": 0}
             elif n == 1:
                 return {"result": [0], "count": 1}
+            elif n > _FIB_SEQUENCE_LIMIT:
+                last = _fib_pair(n - 1)[0]
+                return {
+                    "result": last,
+                    "count": n,
+                    "last": last,
+                    "note": f"Sequence omitted for more than {_FIB_SEQUENCE_LIMIT} terms; result is the last term"
+                }
             fib = [0, 1]
             for i in range(2, n):
                 fib.append(fib[-1] + fib[-2])
@@ -4,8 +4,19 @@ Analyzes text and provides various statistics and insights
 """
 import re
 from collections import Counter
+from functools import lru_cache
 
 
+# Compiled once at import rather than looked up on every call
+_PATTERNS = {
+    'sentence': re.compile(r'[.!?]+'),
+    'word': re.compile(r'\b\w+\b'),
+    'digit': re.compile(r'\d'),
+    'url': re.compile(r'https?://\S+'),
+    'email': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'),
+    'vowel_run': re.compile(r'[aeiou]+'),
+}
+
 def main(text, analysis_type="full"):
     """
     Analyze text and return statistics.
@@ -36,52 +47,59 @@ def main(text, analysis_type="full"):
     return analyses[analysis_type](text)
 
 
-def basic_analysis(text):
+def count_sentences(text):
+    """Count non-empty sentences in text"""
+    return sum(1 for s in _PATTERNS['sentence'].split(text) if s.strip())
+
+
+def basic_analysis(text, words=None, sentence_count=None):
     """Basic text statistics"""
-    words = text.split()
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s for s in sentences if s.strip()]
-    paragraphs = text.split('\n\n')
+    if words is None:
+        words = text.split()
+    if sentence_count is None:
+        sentence_count = count_sentences(text)
+    word_count = len(words)
+    # str.count scans in C without building copies or lists of the text
+    character_count = len(text)
+    whitespace_count = text.count(' ') + text.count('\n') + text.count('\t')
     
     return {
-        "character_count": len(text),
-        "character_count_no_spaces": len(text.replace(' ', '').replace('\n', '')),
-        "word_count": len(words),
-        "sentence_count": len(sentences),
-        "paragraph_count": len(paragraphs),
-        "average_word_length": sum(len(word) for word in words) / len(words) if words else 0,
-        "average_sentence_length": len(words) / len(sentences) if sentences else 0
+        "character_count": character_count,
+        "character_count_no_spaces": character_count - whitespace_count,
+        "word_count": word_count,
+        "sentence_count": sentence_count,
+        "paragraph_count": text.count('\n\n') + 1,
+        "average_word_length": sum(len(word) for word in words) / word_count if words else 0,
+        "average_sentence_length": word_count / sentence_count if sentence_count else 0
     }
 
 
-def readability_analysis(text):
-    """Calculate readability scores"""
-    words = text.split()
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s for s in sentences if s.strip()]
+@lru_cache(maxsize=16384)
+def count_syllables(word):
+    """Count syllables in a word (simplified), cached since prose repeats words"""
+    # Each run of consecutive vowels is one syllable; the regex scans the
+    # word in C instead of classifying it character by character
+    syllable_count = len(_PATTERNS['vowel_run'].findall(word.lower()))
     
-    # Count syllables (simplified)
-    def count_syllables(word):
-        word = word.lower()
-        vowels = "aeiou"
-        syllable_count = 0
-        previous_was_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                syllable_count += 1
-            previous_was_vowel = is_vowel
-        
-        # Ensure at least one syllable
-        return max(1, syllable_count)
+    # Ensure at least one syllable
+    return max(1, syllable_count)
+
+
+def readability_analysis(text, words=None, sentence_count=None):
+    """Calculate readability scores"""
+    if words is None:
+        words = text.split()
+    if sentence_count is None:
+        sentence_count = count_sentences(text)
+    word_count = len(words)
     
-    total_syllables = sum(count_syllables(word) for word in words)
+    # Lowercase first so case variants share cache entries
+    total_syllables = sum(count_syllables(word.lower()) for word in words)
     
     # Flesch Reading Ease
-    if len(sentences) > 0 and len(words) > 0:
-        avg_sentence_length = len(words) / len(sentences)
-        avg_syllables_per_word = total_syllables / len(words)
+    if sentence_count > 0 and word_count > 0:
+        avg_sentence_length = word_count / sentence_count
+        avg_syllables_per_word = total_syllables / word_count
         flesch_score = 206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables_per_word
         
         # Interpret score
@@ -107,19 +125,27 @@ def readability_analysis(text):
         "flesch_reading_ease": round(flesch_score, 2),
         "difficulty_level": difficulty,
         "total_syllables": total_syllables,
-        "average_syllables_per_word": round(total_syllables / len(words), 2) if words else 0
+        "average_syllables_per_word": round(total_syllables / word_count, 2) if words else 0
     }
 
 
-def frequency_analysis(text):
+def frequency_analysis(text, lowered=None):
     """Analyze word and character frequency"""
+    if lowered is None:
+        lowered = text.lower()
+    
     # Word frequency
-    words = re.findall(r'\b\w+\b', text.lower())
+    words = _PATTERNS['word'].findall(lowered)
     word_freq = Counter(words)
     
-    # Character frequency (excluding spaces and newlines)
-    chars = [c.lower() for c in text if c not in ' \n\t']
-    char_freq = Counter(chars)
+    # Character frequency (excluding spaces and newlines). Count the
+    # original characters in C, then merge them by c.lower(): lowering each
+    # character on its own keeps final 'Σ' as 'σ' and 'İ' as one key,
+    # which lowering the whole string does not
+    char_freq = Counter()
+    for char, count in Counter(text).items():
+        if char not in ' \n\t':
+            char_freq[char.lower()] += count
     
     # Most common n-grams
     bigrams = [f"{words[i]} {words[i+1]}" for i in range(len(words)-1)]
@@ -136,14 +162,20 @@ def frequency_analysis(text):
 
 def full_analysis(text):
     """Complete text analysis"""
+    # Tokenize once and share the results instead of letting every
+    # analysis split and lowercase the text again
+    words = text.split()
+    sentence_count = count_sentences(text)
+    lowered = text.lower()
+    
     return {
-        "basic": basic_analysis(text),
-        "readability": readability_analysis(text),
-        "frequency": frequency_analysis(text),
+        "basic": basic_analysis(text, words, sentence_count),
+        "readability": readability_analysis(text, words, sentence_count),
+        "frequency": frequency_analysis(text, lowered),
         "metadata": {
-            "has_numbers": bool(re.search(r'\d', text)),
-            "has_urls": bool(re.search(r'https?://\S+', text)),
-            "has_emails": bool(re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)),
-            "language_hint": "english" if any(word in text.lower() for word in ['the', 'and', 'is', 'in', 'to']) else "unknown"
+            "has_numbers": bool(_PATTERNS['digit'].search(text)),
+            "has_urls": bool(_PATTERNS['url'].search(text)),
+            "has_emails": bool(_PATTERNS['email'].search(text)),
+            "language_hint": "english" if any(word in lowered for word in ['the', 'and', 'is', 'in', 'to']) else "unknown"
         }
     }
\ No newline at end of file
@@ -5,9 +5,197 @@ Fetches and parses web content with various extraction methods
 import re
 import json
 from urllib.parse import urlparse, urljoin
+from dataclasses import dataclass, field
 from html.parser import HTMLParser
 from typing import Dict, List, Any
 
+try:
+    from lxml import etree as lxml_etree, html as lxml_html
+except ImportError:  # Fall back to the pure-Python SimpleHTMLParser
+    lxml_etree = lxml_html = None
+
+try:
+    import hyperscan
+except ImportError:  # Fall back to the re patterns in _PATTERNS
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
+
+HEADING_LEVELS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+# Compiled once at import rather than looked up on every call
+_PATTERNS = {
+    'sentence': re.compile(r'[.!?]+'),
+    'whitespace': re.compile(r'\s+'),
+    'title': re.compile(r'<title>(.*?)</title>', re.IGNORECASE | re.DOTALL),
+    'json_ld': re.compile(
+        r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+        re.IGNORECASE | re.DOTALL
+    ),
+    'email': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'),
+    'url': re.compile(r'https?://(?:[-\w.])+(?::\d+)?(?:/[^\s]*)?'),
+    # Phone number formats, tried in turn
+    'phone': [
+        re.compile(r'\+?1?\s*\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'),  # US format
+        re.compile(r'\+?[0-9]{1,3}[-.\s]?[0-9]{1,4}[-.\s]?[0-9]{1,4}[-.\s]?[0-9]{1,9}'),  # International
+        re.compile(r'\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'),  # Simple format
+    ],
+}
+
+
+# Some orjson releases silently parse integers outside the 64-bit range as
+# floats. Such a literal has at least 19 digits (-9223372036854775809 has
+# 19), which _json_loads finds by mapping every digit to "0" (much faster
+# than a regex) and leaves to the stdlib.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_LONG_DIGIT_RUN = b"0" * 19
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when installed, else with the stdlib json"""
+    if orjson is not None:
+        raw = data.encode("utf-8", "surrogatepass")
+        if raw.translate(_DIGITS_TO_ZERO).find(_LONG_DIGIT_RUN) < 0:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # The stdlib also accepts NaN/Infinity and lone surrogates,
+                # and gives the error message when the input really is invalid
+                pass
+    return json.loads(data)
+
+
+def _scan_expression(pattern) -> bytes:
+    """
+    Hyperscan source for a re pattern.
+
+    Python's \\s on str also matches the ASCII separators \\x1c-\\x1f, which
+    Hyperscan's \\s does not, so they are added to every \\s.
+    """
+    out = []
+    in_class = False
+    i = 0
+    source = pattern.pattern
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            escape = source[i:i + 2]
+            if escape == r"\s":
+                out.append(r"\s\x1c-\x1f" if in_class else r"[\s\x1c-\x1f]")
+            else:
+                out.append(escape)
+            i += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        out.append(char)
+        i += 1
+    return "".join(out).encode("ascii")
+
+
+def _compile_scan_db(patterns):
+    """Compile re patterns into one Hyperscan database, or None if unavailable"""
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[_scan_expression(p) for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=hyperscan.HS_FLAG_SOM_LEFTMOST
+        )
+    except hyperscan.error:
+        return None
+    return db
+
+
+# Hyperscan databases locate matches for all of a kind's patterns in one
+# DFA pass over the content; missing or None entries fall back to plain re.
+# URLs stay on re, which already skips ahead on the literal "http" prefix.
+_SCAN_DBS = {
+    'email': _compile_scan_db([_PATTERNS['email']]),
+    'phone': _compile_scan_db(_PATTERNS['phone']),
+}
+
+
+# Hyperscan match reports allowed per byte of content before _findall gives
+# up on the scan; above roughly this density re alone is faster
+_SCAN_CALLBACK_BUDGET = 1 / 64
+
+
+def _merge_spans(spans):
+    """Merge overlapping (start, end) spans into sorted disjoint regions"""
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def _findall(kind: str, content: str) -> List[str]:
+    """
+    Return re.findall results for each of the `kind` patterns, in order.
+
+    With Hyperscan available, a single scan finds the regions that contain
+    matches and re only runs inside those regions, so the result is
+    identical to re.findall over the whole content. Hyperscan works on
+    bytes with ASCII classes, so non-ASCII content goes straight to re.
+
+    Hyperscan reports every end offset of a match, and each report is a
+    Python callback, so match-dense content (long runs of digits for the
+    phone patterns) is slower than plain re. The scan stops after
+    `_SCAN_CALLBACK_BUDGET` reports per byte and re handles the content.
+    """
+    patterns = _PATTERNS[kind] if isinstance(_PATTERNS[kind], list) else [_PATTERNS[kind]]
+    db = _SCAN_DBS.get(kind)
+    if db is None or not content.isascii():
+        return _re_findall(patterns, content)
+
+    spans = [[] for _ in patterns]
+    budget = 1024 + int(len(content) * _SCAN_CALLBACK_BUDGET)
+
+    def on_match(pattern_id, start, end, flags, context):
+        spans[pattern_id].append((start, end))
+        nonlocal budget
+        budget -= 1
+        # A true return value terminates the scan
+        return budget < 0
+
+    try:
+        db.scan(content.encode("ascii"), match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        return _re_findall(patterns, content)
+
+    matches = []
+    for pattern, pattern_spans in zip(patterns, spans):
+        pos = 0
+        for start, end in _merge_spans(pattern_spans):
+            if end <= pos:
+                continue
+            for match in pattern.finditer(content, max(pos, start), end):
+                matches.append(match.group())
+                pos = match.end()
+    return matches
+
+
+def _re_findall(patterns, content: str) -> List[str]:
+    """re.findall results for each pattern, in order"""
+    return [match for pattern in patterns for match in pattern.findall(content)]
+
+
+# Tags SimpleHTMLParser extracts anything from; all others are skipped
+_EXTRACTED_TAGS = frozenset({"a", "img", "meta", "p", *HEADING_LEVELS})
+
 
 class SimpleHTMLParser(HTMLParser):
     """Simple HTML parser for extracting various elements"""
@@ -20,11 +208,22 @@ class SimpleHTMLParser(HTMLParser):
         self.paragraphs = []
         self.meta_tags = []
         self.current_tag = None
-        self.current_data = ""
+        # Text pieces of the current heading/paragraph, joined at its end tag
+        self.current_data = []
     
     def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
+        # Most tags (div, span, br, ...) are not extracted, so skip them
+        # before paying for an attribute dict
+        if tag not in _EXTRACTED_TAGS:
+            return
+        
+        if tag == "p" or (tag[0] == "h" and tag in self.headings):
+            # Like lxml, a new paragraph or heading ends the current one
+            self._flush()
+            self.current_tag = tag
+            return
         
+        attrs_dict = dict(attrs)
         if tag == "a" and "href" in attrs_dict:
             self.links.append({
                 "href": attrs_dict["href"],
@@ -39,25 +238,107 @@ class SimpleHTMLParser(HTMLParser):
             })
         elif tag == "meta":
             self.meta_tags.append(attrs_dict)
-        elif tag in self.headings:
-            self.current_tag = tag
-            self.current_data = ""
-        elif tag == "p":
-            self.current_tag = "p"
-            self.current_data = ""
     
     def handle_data(self, data):
         if self.current_tag:
-            self.current_data += data.strip()
+            self.current_data.append(data)
     
     def handle_endtag(self, tag):
-        if self.current_tag == tag and self.current_data:
-            if tag in self.headings:
-                self.headings[tag].append(self.current_data)
-            elif tag == "p":
-                self.paragraphs.append(self.current_data)
+        # End tags of nested inline elements (b, a, span, ...) keep collecting
+        if tag == self.current_tag:
+            self._flush()
+    
+    def close(self):
+        super().close()
+        # An unclosed trailing paragraph/heading still counts
+        self._flush()
+    
+    def _flush(self):
+        """Record the current paragraph/heading text with whitespace collapsed"""
+        if self.current_tag is None:
+            return
+        text = " ".join("".join(self.current_data).split())
+        if text:
+            if self.current_tag == "p":
+                self.paragraphs.append(text)
+            else:
+                self.headings[self.current_tag].append(text)
         self.current_tag = None
-        self.current_data = ""
+        self.current_data = []
+
+
+@dataclass
+class ParsedDoc:
+    """Elements extracted from an HTML document"""
+    links: List[Dict[str, str]] = field(default_factory=list)
+    images: List[Dict[str, str]] = field(default_factory=list)
+    headings: Dict[str, List[str]] = field(
+        default_factory=lambda: {level: [] for level in HEADING_LEVELS}
+    )
+    paragraphs: List[str] = field(default_factory=list)
+    meta_tags: List[Dict[str, str]] = field(default_factory=list)
+
+
+def _element_text(element) -> str:
+    """Text content of an lxml element with whitespace collapsed"""
+    return " ".join(element.text_content().split())
+
+
+def _parse_html_fallback(content: str) -> ParsedDoc:
+    """Parse HTML with the pure-Python SimpleHTMLParser"""
+    parser = SimpleHTMLParser()
+    parser.feed(content)
+    parser.close()
+    return ParsedDoc(
+        links=parser.links,
+        images=parser.images,
+        headings=parser.headings,
+        paragraphs=parser.paragraphs,
+        meta_tags=parser.meta_tags
+    )
+
+
+def parse_html(content: str) -> ParsedDoc:
+    """
+    Parse HTML into a ParsedDoc.
+
+    Uses lxml (libxml2) when it is installed, since it parses in C and
+    XPath selects the wanted nodes directly; otherwise falls back to the
+    pure-Python SimpleHTMLParser.
+    """
+    if lxml_html is None or not content.strip():
+        return _parse_html_fallback(content)
+
+    try:
+        try:
+            tree = lxml_html.fromstring(content)
+        except ValueError:
+            # lxml rejects str input that carries an XML encoding declaration
+            tree = lxml_html.fromstring(content.encode("utf-8"))
+    except lxml_etree.ParserError:
+        # "Document is empty": only comments, a doctype or processing
+        # instructions, which SimpleHTMLParser handles fine
+        return _parse_html_fallback(content)
+
+    doc = ParsedDoc(
+        links=[
+            {"href": a.get("href"), "title": a.get("title", ""), "rel": a.get("rel", "")}
+            for a in tree.xpath("//a[@href]")
+        ],
+        images=[
+            {"src": img.get("src"), "alt": img.get("alt", ""), "title": img.get("title", "")}
+            for img in tree.xpath("//img[@src]")
+        ],
+        paragraphs=[
+            text for text in (_element_text(p) for p in tree.xpath("//p")) if text
+        ],
+        meta_tags=[dict(meta.attrib) for meta in tree.xpath("//meta")]
+    )
+    for heading in tree.xpath("|".join(f"//{level}" for level in HEADING_LEVELS)):
+        text = _element_text(heading)
+        if text:
+            doc.headings[heading.tag].append(text)
+    return doc
 
 
 def main(content: str, extract_type: str = "all", options: Dict[str, Any] = None) -> dict:
@@ -76,22 +357,8 @@ def main(content: str, extract_type: str = "all", options: Dict[str, Any] = None
         options = {}
     
     try:
-        parser = SimpleHTMLParser()
-        parser.feed(content)
-        
-        if extract_type == "links":
-            return extract_links(parser, content, options)
-        
-        elif extract_type == "text":
-            return extract_text(parser, content, options)
-        
-        elif extract_type == "metadata":
-            return extract_metadata(parser, content, options)
-        
-        elif extract_type == "structured":
-            return extract_structured(parser, content, options)
-        
-        elif extract_type == "emails":
+        # These scan the raw content and do not need it parsed
+        if extract_type == "emails":
             return extract_emails(content)
         
         elif extract_type == "phone_numbers":
@@ -100,23 +367,7 @@ def main(content: str, extract_type: str = "all", options: Dict[str, Any] = None
         elif extract_type == "urls":
             return extract_urls(content)
         
-        elif extract_type == "all":
-            return {
-                "success": True,
-                "links": parser.links,
-                "images": parser.images,
-                "headings": parser.headings,
-                "paragraphs": parser.paragraphs[:10],  # Limit to first 10
-                "meta_tags": parser.meta_tags,
-                "stats": {
-                    "total_links": len(parser.links),
-                    "total_images": len(parser.images),
-                    "total_headings": sum(len(h) for h in parser.headings.values()),
-                    "total_paragraphs": len(parser.paragraphs)
-                }
-            }
-        
-        else:
+        elif extract_type not in ("all", "links", "text", "metadata", "structured"):
             return {
                 "error": f"Unknown extraction type: {extract_type}",
                 "available_types": [
@@ -124,41 +375,70 @@ def main(content: str, extract_type: str = "all", options: Dict[str, Any] = None
                     "emails", "phone_numbers", "urls"
                 ]
             }
+        
+        doc = parse_html(content)
+        
+        if extract_type == "links":
+            return extract_links(doc, content, options)
+        
+        elif extract_type == "text":
+            return extract_text(doc, content, options)
+        
+        elif extract_type == "metadata":
+            return extract_metadata(doc, content, options)
+        
+        elif extract_type == "structured":
+            return extract_structured(doc, content, options)
+        
+        else:
+            return {
+                "success": True,
+                "links": doc.links,
+                "images": doc.images,
+                "headings": doc.headings,
+                "paragraphs": doc.paragraphs[:10],  # Limit to first 10
+                "meta_tags": doc.meta_tags,
+                "stats": {
+                    "total_links": len(doc.links),
+                    "total_images": len(doc.images),
+                    "total_headings": sum(len(h) for h in doc.headings.values()),
+                    "total_paragraphs": len(doc.paragraphs)
+                }
+            }
     
     except Exception as e:
         return {"error": str(e), "extract_type": extract_type}
 
 
-def extract_links(parser: SimpleHTMLParser, content: str, options: dict) -> dict:
+def extract_links(doc: ParsedDoc, content: str, options: dict) -> dict:
     """Extract and analyze links from HTML"""
     base_url = options.get("base_url", "")
     filter_external = options.get("filter_external", False)
     
-    links = parser.links
-    
-    if base_url:
-        # Convert relative URLs to absolute
-        for link in links:
-            link["absolute_href"] = urljoin(base_url, link["href"])
-            
-        if filter_external:
-            base_domain = urlparse(base_url).netloc
-            links = [
-                link for link in links
-                if urlparse(link.get("absolute_href", link["href"])).netloc == base_domain
-            ]
-    
-    # Categorize links
+    base_domain = urlparse(base_url).netloc if base_url else ""
+    
+    # Resolve, filter and categorize links in a single pass
+    total_links = 0
     internal = []
     external = []
     anchors = []
     
-    for link in links:
-        href = link.get("absolute_href", link["href"])
+    for link in doc.links:
+        href = link["href"]
+        if base_url:
+            # Convert relative URLs to absolute
+            href = link["absolute_href"] = urljoin(base_url, href)
+        is_http = href.startswith(("http://", "https://"))
+        netloc = urlparse(href).netloc if base_url and (is_http or filter_external) else None
+        
+        if base_url and filter_external and netloc != base_domain:
+            continue
+        total_links += 1
+        
         if href.startswith("#"):
             anchors.append(link)
-        elif href.startswith("http://") or href.startswith("https://"):
-            if base_url and urlparse(href).netloc == urlparse(base_url).netloc:
+        elif is_http:
+            if base_url and netloc == base_domain:
                 internal.append(link)
             else:
                 external.append(link)
@@ -167,7 +447,7 @@ def extract_links(parser: SimpleHTMLParser, content: str, options: dict) -> dict
     
     return {
         "success": True,
-        "total_links": len(links),
+        "total_links": total_links,
         "internal_links": internal[:20],  # Limit results
         "external_links": external[:20],
         "anchor_links": anchors[:10],
@@ -179,7 +459,7 @@ def extract_links(parser: SimpleHTMLParser, content: str, options: dict) -> dict
     }
 
 
-def extract_text(parser: SimpleHTMLParser, content: str, options: dict) -> dict:
+def extract_text(doc: ParsedDoc, content: str, options: dict) -> dict:
     """Extract and process text content"""
     include_headings = options.get("include_headings", True)
     max_length = options.get("max_length", 5000)
@@ -188,22 +468,22 @@ def extract_text(parser: SimpleHTMLParser, content: str, options: dict) -> dict:
     
     if include_headings:
         for level in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-            for heading in parser.headings[level]:
+            for heading in doc.headings[level]:
                 if heading:
                     text_parts.append(heading)
     
-    text_parts.extend(parser.paragraphs)
+    text_parts.extend(doc.paragraphs)
     
     # Join and clean text
     full_text = " ".join(text_parts)
-    full_text = re.sub(r'\s+', ' ', full_text).strip()
+    full_text = _PATTERNS['whitespace'].sub(' ', full_text).strip()
     
     if len(full_text) > max_length:
         full_text = full_text[:max_length] + "..."
     
     # Calculate statistics
     words = full_text.split()
-    sentences = re.split(r'[.!?]+', full_text)
+    sentences = _PATTERNS['sentence'].split(full_text)
     
     return {
         "success": True,
@@ -215,14 +495,14 @@ def extract_text(parser: SimpleHTMLParser, content: str, options: dict) -> dict:
             "average_word_length": sum(len(w) for w in words) / len(words) if words else 0
         },
         "headings_summary": {
-            level: headings[:5] for level, headings in parser.headings.items() if headings
+            level: headings[:5] for level, headings in doc.headings.items() if headings
         }
     }
 
 
-def extract_metadata(parser: SimpleHTMLParser, content: str, options: dict) -> dict:
+def extract_metadata(doc: ParsedDoc, content: str, options: dict) -> dict:
     """Extract metadata from HTML"""
-    meta_tags = parser.meta_tags
+    meta_tags = doc.meta_tags
     
     # Extract common metadata
     metadata = {
@@ -238,7 +518,7 @@ def extract_metadata(parser: SimpleHTMLParser, content: str, options: dict) -> d
     }
     
     # Search for title in content
-    title_match = re.search(r'<title>(.*?)</title>', content, re.IGNORECASE | re.DOTALL)
+    title_match = _PATTERNS['title'].search(content)
     if title_match:
         metadata["title"] = title_match.group(1).strip()
     
@@ -273,16 +553,15 @@ def extract_metadata(parser: SimpleHTMLParser, content: str, options: dict) -> d
     }
 
 
-def extract_structured(parser: SimpleHTMLParser, content: str, options: dict) -> dict:
+def extract_structured(doc: ParsedDoc, content: str, options: dict) -> dict:
     """Extract structured data from HTML"""
     # Look for JSON-LD structured data
-    json_ld_pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-    json_ld_matches = re.findall(json_ld_pattern, content, re.IGNORECASE | re.DOTALL)
+    json_ld_matches = _PATTERNS['json_ld'].findall(content)
     
     structured_data = []
     for match in json_ld_matches:
         try:
-            data = json.loads(match.strip())
+            data = _json_loads(match.strip())
             structured_data.append(data)
         except json.JSONDecodeError:
             continue
@@ -293,7 +572,7 @@ def extract_structured(parser: SimpleHTMLParser, content: str, options: dict) ->
     # Build document outline from headings
     outline = []
     for level in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-        for heading in parser.headings[level]:
+        for heading in doc.headings[level]:
             if heading:
                 outline.append({"level": level, "text": heading})
     
@@ -303,16 +582,14 @@ def extract_structured(parser: SimpleHTMLParser, content: str, options: dict) ->
         "has_json_ld": len(structured_data) > 0,
         "microdata_indicators": itemscope_count,
         "document_outline": outline[:20],  # Limit to first 20
-        "images_with_alt": sum(1 for img in parser.images if img.get("alt")),
-        "total_images": len(parser.images)
+        "images_with_alt": sum(1 for img in doc.images if img.get("alt")),
+        "total_images": len(doc.images)
     }
 
 
 def extract_emails(content: str) -> dict:
     """Extract email addresses from content"""
-    # Simple email regex pattern
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = list(set(re.findall(email_pattern, content)))
+    emails = list(set(_findall('email', content)))
     
     return {
         "success": True,
@@ -323,20 +600,8 @@ def extract_emails(content: str) -> dict:
 
 def extract_phone_numbers(content: str) -> dict:
     """Extract phone numbers from content"""
-    # Various phone number patterns
-    patterns = [
-        r'\+?1?\s*\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',  # US format
-        r'\+?[0-9]{1,3}[-.\s]?[0-9]{1,4}[-.\s]?[0-9]{1,4}[-.\s]?[0-9]{1,9}',  # International
-        r'\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',  # Simple format
-    ]
-    
-    phone_numbers = []
-    for pattern in patterns:
-        matches = re.findall(pattern, content)
-        phone_numbers.extend(matches)
-    
     # Remove duplicates and clean
-    phone_numbers = list(set(num.strip() for num in phone_numbers))
+    phone_numbers = list(set(num.strip() for num in _findall('phone', content)))
     
     return {
         "success": True,
@@ -347,9 +612,7 @@ def extract_phone_numbers(content: str) -> dict:
 
 def extract_urls(content: str) -> dict:
     """Extract all URLs from content"""
-    # URL regex pattern
-    url_pattern = r'https?://(?:[-\w.])+(?::\d+)?(?:/[^\s]*)?'
-    urls = list(set(re.findall(url_pattern, content)))
+    urls = list(set(_findall('url', content)))
     
     # Categorize URLs
     domains = {}